@@ -165,7 +165,7 @@ class UriArgument(click.Argument):
             cpath = click.Path(path_type=Path, file_okay=True, resolve_path=True)
             data = cpath.convert(value, None, ctx=ctx)
             if data.exists():
-                return utils.json.load(data.open())
+                return utils.load_json_file(data)
         except ValueError:
             self.fail(f"{value!r} is not a valid frozen file path.", ctx)
 
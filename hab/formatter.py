@@ -64,6 +64,11 @@ class Formatter(string.Formatter):
     string that accepts the env var name. ``;`` is the path separator to use.
     """
 
+    _ext_languages = {".bat": "batch", ".cmd": "batch", ".ps1": "ps"}
+    """Maps file exts to the language name returned by `language_from_ext`. The
+    language for ``.sh`` depends on the platform, see `BasePlatform.sh_language`.
+    """
+
     def __init__(self, language, expand=False):
         super().__init__()
         self.language = self.language_from_ext(language)
@@ -101,17 +106,10 @@ class Formatter(string.Formatter):
         the format will be replaced with the same format command so future format
         calls can re-apply the changes. Any other value passed is returned unmodified.
         """
-        if ext in (".bat", ".cmd"):
-            return "batch"
-        elif ext == ".ps1":
-            return "ps"
-        elif ext in (".sh", ""):
+        if ext in (".sh", ""):
             # Assume no ext is a .sh file
-            if utils.Platform.name() == "windows":
-                return "shwin"
-            else:
-                return "sh"
-        return ext
+            return utils.Platform.sh_language()
+        return cls._ext_languages.get(ext, ext)
 
     def parse(self, txt):
         for literal_text, field_name, format_spec, conversion in super().parse(txt):
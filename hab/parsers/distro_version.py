@@ -38,7 +38,7 @@ class DistroVersion(HabBase):
             self.version = data["version"]
             return self.version
         elif version_txt.exists():
-            self.version = version_txt.open().read().strip()
+            self.version = version_txt.read_text().strip()
             return self.version
 
         # If version is not defined in json data extract it from the parent
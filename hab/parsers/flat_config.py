@@ -186,7 +186,17 @@ class FlatConfig(Config):
         # ensure the version environments are flattened into the environment
         self.environment
 
-        frozen_data = deepcopy(self.frozen_data)
+        # Only deep copy the data that is actually stored in the freeze. Versions
+        # contains DistroVersion objects, deep copying them would also copy the
+        # entire distro forest and resolver they reference.
+        # No need to store the environment_config in a freeze, and inherits will
+        # always be False.
+        frozen_data = {
+            key: value
+            for key, value in self.frozen_data.items()
+            if key not in ("environment_config", "inherits", "versions")
+        }
+        frozen_data = deepcopy(frozen_data)
         frozen_data["uri"] = self.uri
         if "versions" in self.frozen_data:
             frozen_data["versions"] = [v.name for v in self.frozen_data["versions"]]
@@ -195,12 +205,6 @@ class FlatConfig(Config):
         for platform in frozen_data.get("environment", {}):
             frozen_data["environment"][platform].pop("HAB_URI", None)
 
-        # No need to store the environment_config in a freeze
-        frozen_data.pop("environment_config", None)
-
-        # No need to store this it will always be False
-        frozen_data.pop("inherits", None)
-
         # Remove any empty properties that are not required
         for key in ("aliases", "versions"):
             if key in frozen_data and not frozen_data[key]:
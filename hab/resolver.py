@@ -321,7 +321,7 @@ class Resolver(object):
         if forest is None:
             forest = {}
         for dirname, path in self.site.config_paths(config_paths):
-            Config(forest, self, path, root_paths=set((dirname,)))
+            Config(forest, self, path, root_paths={dirname})
         return forest
 
     def parse_distros(self, distro_paths, forest=None):
@@ -329,7 +329,7 @@ class Resolver(object):
             forest = {}
         for dirname, path in self.site.distro_paths(distro_paths):
             try:
-                DistroVersion(forest, self, path, root_paths=set((dirname,)))
+                DistroVersion(forest, self, path, root_paths={dirname})
             except _IgnoredVersionError as error:
                 logger.debug(str(error))
         return forest
@@ -29,8 +29,24 @@ except ImportError:
         """Placeholder exception when pyjson5 is not used. Should never be raised"""
 
 
+# Attempt to use orjson if its installed, this speeds up reading and writing
+# large json documents like `hab dump --format json`, but is not required.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
 colorama.init()
 
+re_cygpath_separator = re.compile(
+    # Capture spaces including any leading backslashes to escape
+    r"(\\* )"
+    # If we can't find any spaces, capture backslashes to convert to forward-slash
+    r"|(\\+)"
+)
+"""A regex used by `cygpath` to find spaces and backslashes to convert."""
+
 re_windows_single_path = re.compile(r"^([a-zA-Z]:[\\\/][^:;]+)$")
 """A regex that can be used to check if a string is a single windows file path."""
 
@@ -62,13 +78,7 @@ def cygpath(path, spaces=False):
         # Add a backslash to escape spaces if enabled
         return sep.replace(" ", "\\ ")
 
-    pattern = (
-        # Capture spaces including any leading backslashes to escape
-        r"(\\* )"
-        # If we can't find any spaces, capture backslashes to convert to forward-slash
-        r"|(\\+)"
-    )
-    path = re.sub(pattern, process_separator, path)
+    path = re_cygpath_separator.sub(process_separator, path)
 
     # Finally, convert `C:\` drive specifier to `/c/`. Unc paths don't need any
     # additional processing, just converting \ to / which was done previously.
@@ -106,7 +116,7 @@ def decode_freeze(txt):
         data = zlib.decompress(data).decode()
     else:
         return None
-    return json.loads(data)
+    return loads_json(data)
 
 
 def dump_object(obj, label="", width=80, flat_list=False, color=False):
@@ -214,10 +224,40 @@ def dumps_json(data, **kwargs):
 
     Pyjson5's dump is not as fully featured as python's json, so this ensures
     consistent dumps output as python's json module has more features than
-    pyjson5. For example pyjson5 doesn't support indent."""
-    kwargs.setdefault("cls", HabJsonEncoder)
+    pyjson5. For example pyjson5 doesn't support indent.
+
+    If orjson is installed, it is used to speed up dumps calls using an indent
+    of 2. Its output is not always identical to python's json module. Floats
+    using exponents are formatted differently (``1e16`` instead of ``1e+16``),
+    NaN and Infinity are written as ``null`` and some types like Enum are
+    serialized instead of raising a TypeError. If orjson can't serialize the
+    data, like non-str keys or integers larger than 64 bits, python's json module
+    is used."""
     # Sort dictionaries by key for consistent freeze and diff.
     kwargs.setdefault("sort_keys", True)
+
+    # If orjson is installed use it to speed up dumping the data. It only supports
+    # an indent of 2 and doesn't escape non-ascii characters, so fall back to
+    # python's json module for anything else.
+    if (
+        orjson
+        and kwargs.get("indent") == 2
+        and kwargs.keys() <= {"indent", "sort_keys"}
+    ):
+        # Note: Non-str keys are not enabled so they fall back to python's json
+        # module. orjson would sort them after converting them to strings.
+        option = orjson.OPT_INDENT_2
+        if kwargs["sort_keys"]:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            ret = orjson.dumps(data, default=HabJsonEncoder().default, option=option)
+            # Decoding non-ascii output raises a UnicodeDecodeError so python's
+            # json module can escape it. Note: bytes.isascii requires python 3.7
+            return ret.decode("ascii")
+        except (orjson.JSONEncodeError, UnicodeDecodeError):
+            pass
+
+    kwargs.setdefault("cls", HabJsonEncoder)
     return _json.dumps(data, **kwargs)
 
 
@@ -296,7 +336,7 @@ def load_json_file(filename):
 
     with filename.open() as fle:
         try:
-            data = json.load(fle)
+            data = loads_json(fle.read())
         # Include the filename in the traceback to make debugging easier
         except _JsonException as e:
             # pyjson5 is installed add filename to the traceback
@@ -313,6 +353,22 @@ def load_json_file(filename):
     return data
 
 
+def loads_json(txt):
+    """Parse a json string into python objects.
+
+    If orjson is installed, it is used to speed up parsing. orjson only supports
+    strict json, so anything it can't parse like json5 comments is parsed by
+    pyjson5 if installed, otherwise python's json module. This ensures that the
+    exceptions raised for invalid json are consistent if orjson is used or not.
+    """
+    if orjson:
+        try:
+            return orjson.loads(txt)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(txt)
+
+
 def natural_sort(ls, key=None):
     """Sort a list in a more natural way by treating contiguous integers as a
     single number instead of processing each number individually. This function
@@ -409,6 +465,7 @@ class BasePlatform(ABC):
     _default_ext = ".sh"
     _name = None
     _sep = ":"
+    _sh_language = "sh"
 
     @classmethod
     def configure_logging(cls, filename=None):
@@ -525,6 +582,11 @@ class BasePlatform(ABC):
         """The path separator used by this platform."""
         return cls._sep
 
+    @classmethod
+    def sh_language(cls):
+        """The `hab.formatter.Formatter` language used for ``.sh`` scripts."""
+        return cls._sh_language
+
     @classmethod
     def system(cls):
         """Returns the current operating system as `windows`, `osx` or `linux`."""
@@ -544,6 +606,7 @@ class WinPlatform(BasePlatform):
     _default_ext = ".bat"
     _name = "windows"
     _sep = ";"
+    _sh_language = "shwin"
 
     @classmethod
     def check_name(cls, name):
@@ -6,7 +6,7 @@ from pathlib import Path, PurePath
 import pytest
 from packaging.requirements import Requirement
 
-from hab import Resolver, Site
+from hab import Resolver, Site, utils
 
 # Testing both cached and uncached every time adds extra testing time. This env
 # var can be used to disable cached testing for local testing.
@@ -16,6 +16,14 @@ else:
     resolver_tests = ["uncached", "cached"]
 
 
+def pytest_configure(config):
+    # Tests marked with this launch blocking subprocesses, so are slower than
+    # most tests. They can be skipped with `-m "not subprocess"`.
+    config.addinivalue_line(
+        "markers", "subprocess: Tests that launch blocking subprocesses."
+    )
+
+
 @pytest.fixture(scope="session")
 def config_root():
     return Path(__file__).parent
@@ -33,7 +41,7 @@ def generate_habcached_site_file(config_root, dest):
 
     # Load the site_main.json files contents so we can modify it before saving
     # it into the dest for testing.
-    data = json.load(site_src.open())
+    data = utils.load_json_file(site_src)
     append = data["append"]
 
     # Hard code relative_root to the tests folder so it works from
@@ -97,6 +105,50 @@ def uncached_resolver(config_root):
     return Resolver(site=site)
 
 
+@pytest.fixture(scope="session")
+def uncached_resolver_session(config_root):
+    """Return a standard testing resolver not using any habcache files that is
+    shared for the entire testing session.
+
+    Only use this for tests that don't modify the resolver or its site, otherwise
+    use `uncached_resolver`.
+    """
+    site = Site([config_root / "site_main.json"])
+    return Resolver(site=site)
+
+
+@pytest.fixture(scope="session")
+def entry_point_resolver(config_root):
+    """Return a resolver using `site/site_entry_point_a.json` merged on top of
+    `site_main.json` that is shared for the entire testing session.
+
+    Only use this for tests that don't modify the resolver or its site.
+    """
+    site = Site(
+        [config_root / "site/site_entry_point_a.json", config_root / "site_main.json"]
+    )
+    return Resolver(site=site)
+
+
+@pytest.fixture(scope="session")
+def frozen_json(config_root):
+    """The parsed contents of `frozen.json` shared for the entire testing session.
+
+    Tests that modify the returned dict must modify a `copy.deepcopy` of it.
+    """
+    return utils.load_json_file(config_root / "frozen.json")
+
+
+@pytest.fixture(scope="session")
+def frozen_no_distros_json(config_root):
+    """The parsed contents of `frozen_no_distros.json` shared for the entire
+    testing session.
+
+    Tests that modify the returned dict must modify a `copy.deepcopy` of it.
+    """
+    return utils.load_json_file(config_root / "frozen_no_distros.json")
+
+
 @pytest.fixture(params=resolver_tests)
 def resolver(request):
     """Returns a hab.Resolver instance using the site_main.json site config file.
@@ -111,6 +163,21 @@ def resolver(request):
     return request.getfixturevalue(test_map[request.param])
 
 
+@pytest.fixture(params=("orjson", "json"))
+def json_backend(request, monkeypatch):
+    """Runs the test with and without orjson used by `hab.utils` and returns the
+    name of the backend being tested.
+
+    The "orjson" case is skipped if orjson is not installed. The "json" case
+    disables orjson so python's json module, or pyjson5 if installed, is used.
+    """
+    if request.param == "json":
+        monkeypatch.setattr(utils, "orjson", None)
+    elif utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
 class Helpers(object):
     """A collection of reusable functions that tests can use."""
 
@@ -179,8 +246,9 @@ class Helpers(object):
     def compare_files(generated, check):
         """Assert two files are the same with easy to read errors.
 
-        First compares the number of lines for differences, then checks each line
-        for differences raising an AssertionError on the first difference.
+        If the file contents are identical it returns without any further checks.
+        Otherwise it compares the number of lines for differences, then checks each
+        line for differences raising an AssertionError on the first difference.
 
         Args:
             generated (pathlib.Path): The file generated for testing. This will
@@ -189,8 +257,17 @@ class Helpers(object):
             check (pathlib.Path): Compare generated to this check file. It is
                 normally committed inside the hab/tests folder.
         """
-        check = check.open().readlines()
-        cache = generated.open().readlines()
+        # Fast path, no need to process each line if the files are identical.
+        with open(check, "rb") as fle:
+            check_bytes = fle.read()
+        with open(generated, "rb") as fle:
+            if fle.read() + b"\n" == check_bytes:
+                return
+
+        with open(check) as fle:
+            check = fle.readlines()
+        with open(generated) as fle:
+            cache = fle.readlines()
         # Add trailing white space to match template file's trailing white space
         cache[-1] += "\n"
         cache_len = len(cache)
@@ -59,9 +59,11 @@ cy = Fore.YELLOW
         ),
     ),
 )
-def test_format_parser_uri(config_root, uncached_resolver, uri, pre, color, zero, one):
+def test_format_parser_uri(
+    config_root, uncached_resolver_session, uri, pre, color, zero, one
+):
     """Test various uses of `hab.parsers.format_parser.FormatParser`."""
-    cfg = uncached_resolver.closest_config(uri)
+    cfg = uncached_resolver_session.closest_config(uri)
 
     # Test verbosity set to zero
     formatter = FormatParser(0, color=color)
@@ -74,12 +76,12 @@ def test_format_parser_uri(config_root, uncached_resolver, uri, pre, color, zero
     assert result == one.format(filename=cfg.filename)
 
 
-def test_dump_forest_callable(uncached_resolver, config_root):
+def test_dump_forest_callable(uncached_resolver_session, config_root):
     """Check that Resolver.dump_forest handles passing a callable to fmt."""
     formatter = FormatParser(1, color=False)
     result = []
-    for line in uncached_resolver.dump_forest(
-        uncached_resolver.distros, attr="name", fmt=formatter.format, truncate=3
+    for line in uncached_resolver_session.dump_forest(
+        uncached_resolver_session.distros, attr="name", fmt=formatter.format, truncate=3
     ):
         result.append(line)
 
@@ -1,22 +1,9 @@
-import pytest
-
 from hab import utils
 from hab.formatter import Formatter
 from hab.parsers import Config
 
 
-@pytest.mark.parametrize(
-    "language,expanded,not_expanded",
-    (
-        ("sh", "_V_a-var_:_$INVALID_", "_V_$VALID_:_$INVALID_"),
-        # Bash formatting is different on windows for env vars
-        ("shwin", "_V_a-var_:_$INVALID_", "_V_$VALID_:_$INVALID_"),
-        ("ps", "_V_a-var_;_$env:INVALID_", "_V_$env:VALID_;_$env:INVALID_"),
-        ("batch", "_V_a-var_;_%INVALID%_", "_V_%VALID%_;_%INVALID%_"),
-        (None, "_V_a-var_{;}_{INVALID!e}_", "_V_{VALID!e}_{;}_{INVALID!e}_"),
-    ),
-)
-def test_env_format(language, expanded, not_expanded, monkeypatch):
+def test_env_format(monkeypatch):
     """Check that the custom Formatter class works as expected.
 
     This check tests:
@@ -33,12 +20,24 @@ def test_env_format(language, expanded, not_expanded, monkeypatch):
     monkeypatch.delenv("INVALID", raising=False)
 
     fmt = "_{regular_var}_{VALID!e}_{;}_{INVALID!e}_"
+    checks = (
+        ("sh", "_V_a-var_:_$INVALID_", "_V_$VALID_:_$INVALID_"),
+        # Bash formatting is different on windows for env vars
+        ("shwin", "_V_a-var_:_$INVALID_", "_V_$VALID_:_$INVALID_"),
+        ("ps", "_V_a-var_;_$env:INVALID_", "_V_$env:VALID_;_$env:INVALID_"),
+        ("batch", "_V_a-var_;_%INVALID%_", "_V_%VALID%_;_%INVALID%_"),
+        (None, "_V_a-var_{;}_{INVALID!e}_", "_V_{VALID!e}_{;}_{INVALID!e}_"),
+    )
 
-    # Check that "!e" is converted to the correct shell specific specifier.
-    assert Formatter(language).format(fmt, regular_var="V") == not_expanded
+    for language, expanded, not_expanded in checks:
+        # Check that "!e" is converted to the correct shell specific specifier.
+        formatter = Formatter(language)
+        assert formatter.format(fmt, regular_var="V") == not_expanded, language
 
-    # Check that "!e" uses the env var value if `expand=True` not the shell specifier.
-    assert Formatter(language, expand=True).format(fmt, regular_var="V") == expanded
+        # Check that "!e" uses the env var value if `expand=True` not the shell
+        # specifier.
+        formatter = Formatter(language, expand=True)
+        assert formatter.format(fmt, regular_var="V") == expanded, language
 
 
 def test_language_from_ext(monkeypatch):
@@ -62,9 +61,9 @@ def test_language_from_ext(monkeypatch):
         assert Formatter.language_from_ext("") == "sh"
 
 
-def test_format_environment_value(uncached_resolver):
+def test_format_environment_value(uncached_resolver_session):
     forest = {}
-    config = Config(forest, uncached_resolver)
+    config = Config(forest, uncached_resolver_session)
 
     # test_format_environment_value doesn't replace the special formatters.
     # This allows us to delay these formats to only when creating the final
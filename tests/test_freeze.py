@@ -1,4 +1,6 @@
+import json
 import os
+from copy import deepcopy
 from pathlib import PurePosixPath, PureWindowsPath
 
 import pytest
@@ -18,15 +20,12 @@ def update_config(check, config_root, platform):
             "c:\\" for windows and "/hab" for linux is used.
         platform (str): The current platform the test is running on.
     """
+    roots = {"windows": "c:", "linux": "/hab", platform: str(config_root)}
     env = check["environment"]
-    for plat in env:
-        if plat == platform:
-            cfg_root = config_root
-        else:
-            cfg_root = "c:" if plat == "windows" else "/hab"
-        for k, values in env[plat].items():
-            for i, v in enumerate(values):
-                env[plat][k][i] = v.format(config_root=cfg_root)
+    for plat, variables in env.items():
+        cfg_root = roots[plat]
+        for k, values in variables.items():
+            variables[k] = [v.replace("{config_root}", cfg_root) for v in values]
 
 
 def test_json_dumps():
@@ -43,8 +42,36 @@ def test_json_dumps():
     )
 
 
+def test_json_dumps_orjson(json_backend):
+    """Check that dumps_json returns the same output as python's json module
+    if orjson is used or not."""
+    data = {"b": [1, {}, []], "a": {"NotSet": NotSet, "value": 1.5}, "c": "text"}
+    check = json.dumps(data, indent=2, sort_keys=True, cls=utils.HabJsonEncoder)
+    assert utils.dumps_json(data, indent=2) == check
+
+    # Non-ascii characters are escaped the same as python's json module
+    data["c"] = "t\u00e9xt"
+    check = json.dumps(data, indent=2, sort_keys=True, cls=utils.HabJsonEncoder)
+    assert utils.dumps_json(data, indent=2) == check
+
+    # Integers larger than orjson supports fall back to python's json module
+    data["c"] = 2**64
+    check = json.dumps(data, indent=2, sort_keys=True, cls=utils.HabJsonEncoder)
+    assert utils.dumps_json(data, indent=2) == check
+
+    # Non-str keys are sorted the same as python's json module
+    data["c"] = {2: "a", 10: "b"}
+    check = json.dumps(data, indent=2, sort_keys=True, cls=utils.HabJsonEncoder)
+    assert utils.dumps_json(data, indent=2) == check
+
+    # orjson formats float exponents differently, but the value is preserved
+    data["c"] = 1e16
+    check = json.dumps(data, indent=2, sort_keys=True, cls=utils.HabJsonEncoder)
+    assert json.loads(utils.dumps_json(data, indent=2)) == json.loads(check)
+
+
 @pytest.mark.parametrize("platform,pathsep", (("win32", ";"), ("linux", ":")))
-def test_freeze(monkeypatch, config_root, platform, pathsep):
+def test_freeze(monkeypatch, config_root, frozen_json, platform, pathsep):
     monkeypatch.setattr(utils, "Platform", utils.WinPlatform)
     monkeypatch.setattr(os, "pathsep", pathsep)
     site = Site([config_root / "site_main.json"])
@@ -89,8 +116,7 @@ def test_freeze(monkeypatch, config_root, platform, pathsep):
     assert cfg.frozen_data["environment"]["windows"]["HAB_URI"] == ["not_set/distros"]
 
     ret = cfg.freeze()
-    check_file = config_root / "frozen.json"
-    check = utils.json.load(check_file.open())
+    check = deepcopy(frozen_json)
     # Apply template values so we can easily check against frozen.
     update_config(check, cfg_root, site.platform)
 
@@ -109,11 +135,9 @@ def test_freeze(monkeypatch, config_root, platform, pathsep):
     assert "alias_mods" not in ret
 
 
-def test_unfreeze(config_root, resolver):
-    check_file = config_root / "frozen.json"
-
+def test_unfreeze(frozen_json, frozen_no_distros_json, resolver):
     # Note: For this test, we don't need to worry about "{config_root}" templates.
-    frozen_config = utils.json.load(check_file.open())
+    frozen_config = deepcopy(frozen_json)
     cfg = UnfrozenConfig(frozen_config, resolver)
 
     assert cfg.context == frozen_config["context"]
@@ -150,8 +174,7 @@ def test_unfreeze(config_root, resolver):
     assert cfg.alias_mods is NotSet
 
     # Check passing a string to UnfrozenConfig instead of a dict
-    check_file = config_root / "frozen_no_distros.json"
-    checks = utils.json.load(check_file.open())
+    checks = deepcopy(frozen_no_distros_json)
     v2 = checks["version2"]
     cfg = UnfrozenConfig(v2, resolver)
 
@@ -162,25 +185,26 @@ def test_unfreeze(config_root, resolver):
     assert cfg.frozen_data == check
 
 
-def test_decode_freeze(config_root):
-    check_file = config_root / "frozen_no_distros.json"
-    checks = utils.json.load(check_file.open())
+def test_decode_freeze(frozen_no_distros_json):
+    checks = frozen_no_distros_json
     v1 = checks["version1"]
     raw = checks["raw"]
+    # The encoded data without its version prefix
+    suffix = v1[3:]
 
     # Check that supported freeze's are decoded correctly
     assert utils.decode_freeze(v1) == raw
     assert utils.decode_freeze(checks["version2"]) == raw
 
     # Check that padded versions are also supported
-    assert utils.decode_freeze(f"v01:{v1[3:]}") == raw
+    assert utils.decode_freeze(f"v01:{suffix}") == raw
 
     # Check that non-versioned freeze strings raise an helpful exception
     for check in (
         # Missing `v1:`
-        v1[3:],
+        suffix,
         # Missing `v'
-        f"1:{v1[3:]}",
+        f"1:{suffix}",
     ):
         with pytest.raises(
             ValueError, match=r"Missing freeze version information in format `v0:...`"
@@ -189,17 +213,16 @@ def test_decode_freeze(config_root):
 
     # Check that versions other than numbers raise a helpful exception
     with pytest.raises(ValueError, match=r"Version INVALID is not valid."):
-        utils.decode_freeze(f"vINVALID:{v1[3:]}")
+        utils.decode_freeze(f"vINVALID:{suffix}")
 
     # check that other version encodings return nothing
-    assert utils.decode_freeze(f"v3:{v1[3:]}") is None
-    assert utils.decode_freeze(f"v0:{v1[3:]}") is None
+    assert utils.decode_freeze(f"v3:{suffix}") is None
+    assert utils.decode_freeze(f"v0:{suffix}") is None
 
 
-def test_encode_freeze(config_root, resolver):
+def test_encode_freeze(frozen_no_distros_json, resolver):
     cfg = resolver.resolve("not_set/no_distros")
-    check_file = config_root / "frozen_no_distros.json"
-    checks = utils.json.load(check_file.open())
+    checks = frozen_no_distros_json
 
     # Check that the dict contains the expected contents
     freeze = cfg.freeze()
@@ -232,7 +255,9 @@ def test_encode_freeze(config_root, resolver):
     assert version1 == checks["version2"]
 
 
-def test_resolver_freeze_configs(tmpdir, config_root, uncached_resolver, helpers):
+def test_resolver_freeze_configs(
+    tmpdir, config_root, uncached_resolver_session, helpers
+):
     """Test `Resolver.freeze_configs`.
 
     This method generates the frozen config for all non-placeholder URI's hab
@@ -241,7 +266,7 @@ def test_resolver_freeze_configs(tmpdir, config_root, uncached_resolver, helpers
     It checks the output against `tests/resolver_freeze_configs.json`. For testing
     simplicity, this file has had its aliases and environment sections removed.
     """
-    result = uncached_resolver.freeze_configs()
+    result = uncached_resolver_session.freeze_configs()
     # Simplify the test by removing dynamic data containing paths. Other tests
     # verify that a specific URI can be frozen successfully. This test verifies
     # that freeze_configs generates a consistent output for all URI's.
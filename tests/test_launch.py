@@ -7,7 +7,7 @@ import sys
 
 import pytest
 
-from hab import Resolver, Site, utils
+from hab import utils
 from hab.errors import HabError, InvalidAliasError
 
 
@@ -26,12 +26,12 @@ def missing_annotations_hack(function):
 
     TODO: Figure out a better method until we can drop CentOS requirement.
     """
+    # Only python 3.6 needs this work around, don't wrap function for others.
+    if sys.version_info.minor != 6:
+        return function
 
     @functools.wraps(function)
     def new_function(*args, **kwargs):
-        if sys.version_info.minor != 6:
-            return function(*args, **kwargs)
-
         site_packages = site.getsitepackages()
         for path in site_packages:
             pth = os.path.join(path, "_virtualenv.pth")
@@ -49,6 +49,7 @@ def missing_annotations_hack(function):
     return new_function
 
 
+@pytest.mark.subprocess
 def test_launch(resolver):
     """Check the Config.launch method."""
     cfg = resolver.resolve("app/aliased/mod")
@@ -72,6 +73,7 @@ def test_launch(resolver):
     assert "\n".join(check) in proc.output_stdout
 
 
+@pytest.mark.subprocess
 @missing_annotations_hack
 def test_launch_str(resolver):
     cfg = resolver.resolve("app/aliased/mod")
@@ -83,11 +85,10 @@ def test_launch_str(resolver):
     assert proc.output_stdout.strip() == "success"
 
     # Check that passing env is respected
-    env = dict(os.environ)
     var_name = "TEST_ADDED_VARIABLE"
     var_value = "Test variable"
-    assert var_name not in env
-    env[var_name] = var_value
+    assert var_name not in os.environ
+    env = {**os.environ, var_name: var_value}
 
     # Check that Popen kwargs can be passed through launch, including env.
     args = [
@@ -97,6 +98,7 @@ def test_launch_str(resolver):
     proc = cfg.launch("as_str", args=args, blocking=True, env=env)
 
 
+@pytest.mark.subprocess
 @pytest.mark.skipif(sys.platform != "win32", reason="only applies on windows")
 def test_pythonw(monkeypatch, resolver):
     """Check that sys.stdin is set if using pythonw."""
@@ -107,7 +109,7 @@ def test_pythonw(monkeypatch, resolver):
     assert proc.stdin is None
 
     # If using pythonw.exe, proc.stdin is routed to PIPE
-    pyw = re.sub("python.exe", "pythonw.exe", sys.executable, flags=re.I)
+    pyw = re.sub(r"python\.exe", "pythonw.exe", sys.executable, flags=re.I)
     monkeypatch.setattr(sys, "executable", pyw)
     proc = cfg.launch("global", args=None, blocking=True)
     assert proc.stdin is not None
@@ -129,14 +131,18 @@ def test_invalid_alias(resolver):
         cfg.launch("global")
 
 
-def test_cls_no_entry_point(resolver):
+@pytest.mark.subprocess
+def test_cls_no_entry_point(uncached_resolver_session):
     """Check that if no entry point is defined, `hab.launcher.Launcher` is
     used to launch the alias.
     """
-    entry_points = resolver.site.entry_points_for_group("hab.launch_cls")
+    # Note: The launch cls is not affected by habcache so this only tests the
+    # uncached resolver to reduce the number of subprocesses launched.
+    site = uncached_resolver_session.site
+    entry_points = site.entry_points_for_group("hab.launch_cls")
     assert len(entry_points) == 0
 
-    cfg = resolver.resolve("app/aliased/mod")
+    cfg = uncached_resolver_session.resolve("app/aliased/mod")
     proc = cfg.launch("global", blocking=True)
 
     from hab.launcher import Launcher
@@ -148,11 +154,10 @@ def test_cls_no_entry_point(resolver):
     assert type(proc) is Topen
 
 
-def test_cls_entry_point(config_root):
+@pytest.mark.subprocess
+def test_cls_entry_point(entry_point_resolver):
     """Check that if an entry point is defined, it is used unless overridden."""
-    site = Site(
-        [config_root / "site/site_entry_point_a.json", config_root / "site_main.json"]
-    )
+    site = entry_point_resolver.site
     entry_points = site.entry_points_for_group("hab.launch_cls")
     assert len(entry_points) == 1
     # Test that the `test-gui` `hab.cli` entry point is handled correctly
@@ -161,8 +166,7 @@ def test_cls_entry_point(config_root):
     assert ep.group == "hab.launch_cls"
     assert ep.value == "subprocess:Popen"
 
-    resolver = Resolver(site=site)
-    cfg = resolver.resolve("app/aliased/mod")
+    cfg = entry_point_resolver.resolve("app/aliased/mod")
 
     # Check that entry_point site config is respected
     proc = cfg.launch("global", blocking=True)
@@ -173,21 +177,15 @@ def test_cls_entry_point(config_root):
     assert type(proc) is Topen
 
 
-def test_alias_entry_point(config_root):
+@pytest.mark.subprocess
+def test_alias_entry_point(entry_point_resolver):
     """Check that if an entry point is defined on a complex alias, it is used."""
-    site = Site(
-        [config_root / "site/site_entry_point_a.json", config_root / "site_main.json"]
-    )
-
-    resolver = Resolver(site=site)
-    cfg = resolver.resolve("app/aliased/mod")
+    # Note: Modifying the resolved cfg doesn't modify the shared resolver.
+    cfg = entry_point_resolver.resolve("app/aliased/mod")
 
     # NOTE: We need to compare the name of the classes because they are separate
     # imports that don't compare equal using `is`.
-
-    # Check that entry_point site config is respected
-    proc = cfg.launch("global", blocking=True)
-    assert type(proc).__name__ == "Popen"
+    # `test_cls_entry_point` checks that the site config is respected.
 
     # Check that if the complex alias specifies hab.launch_cls, it is used instead
     # of the site defined or default class.
@@ -197,6 +195,7 @@ def test_alias_entry_point(config_root):
     assert type(proc).__name__ == "Topen"
 
 
+@pytest.mark.subprocess
 @pytest.mark.parametrize("exit_code", [5, 4, 0])
 class TestCliExitCodes:
     """Test that calling `hab launch` runs python and passes a complex command string
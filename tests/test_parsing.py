@@ -66,6 +66,15 @@ class TestLoadJsonFile:
             # If pyjson5 was used, check that the filename was added to the result dict
             assert f"{{'filename': {str(path)!r}}}" in str(excinfo.value)
 
+    def test_orjson(self, config_root, json_backend):
+        """The same data is returned if orjson is used or not. Invalid json is
+        still parsed by json or pyjson5 so its exceptions are consistent."""
+        path = config_root / "site_main.json"
+        assert utils.load_json_file(path) == json.loads(path.read_text())
+        assert utils.loads_json('{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+        with pytest.raises(ValueError):
+            utils.loads_json('{"a": ')
+
     def test_config_load(self, uncached_resolver):
         cfg = Config({}, uncached_resolver)
 
@@ -84,7 +93,7 @@ def test_distro_parse(config_root, resolver):
     app = DistroVersion(forest, resolver)
     path = config_root / "distros" / "all_settings" / "0.1.0.dev1" / ".hab.json"
     app.load(path)
-    check = json.load(path.open())
+    check = utils.load_json_file(path)
     # Add dynamic alias settings like "distro" to the testing reference.
     # That should never be defined in the raw alias json data.
     app.standardize_aliases(check["aliases"])
@@ -101,7 +110,7 @@ def test_distro_parse(config_root, resolver):
     app = DistroVersion(forest, resolver)
     path = config_root / "distros" / "maya2020" / "2020.0" / ".hab.json"
     app.load(path)
-    check = json.load(path.open())
+    check = utils.load_json_file(path)
 
     # tests\distros\maya\2020.0\.hab.json does not have "version"
     # defined. This allows us to test that DistroVersion will pull the
@@ -210,7 +219,7 @@ def test_config_parse(config_root, resolver, helpers):
     helpers.assert_requirements_equal(config.distros, check)
 
     # Check that the forest was populated correctly
-    assert set(forest.keys()) == set(["default"])
+    assert set(forest.keys()) == {"default"}
     assert forest["default"] == config
 
 
@@ -223,7 +232,8 @@ def test_config_parenting(config_root, resolver):
         return [repr(x) for x in anytree.iterators.PreOrderIter(node)]
 
     forest = {}
-    root_paths = set((config_root,))
+    root_paths = {config_root}
+    project_a = config_root / "configs" / "project_a"
     # Ensure the forest has multiple trees when processing
     shared_path = config_root / "configs" / "default" / "default.json"
     Config(forest, resolver, filename=shared_path, root_paths=root_paths)
@@ -233,10 +243,7 @@ def test_config_parenting(config_root, resolver):
     Config(
         forest,
         resolver,
-        filename=config_root
-        / "configs"
-        / "project_a"
-        / "project_a_Sc001_animation.json",
+        filename=project_a / "project_a_Sc001_animation.json",
         root_paths=root_paths,
     )
     check = [
@@ -247,7 +254,7 @@ def test_config_parenting(config_root, resolver):
     assert check == repr_list(forest["project_a"])
 
     # Check that a middle plcaeholder was replaced
-    mid_level_path = config_root / "configs" / "project_a" / "project_a_Sc001.json"
+    mid_level_path = project_a / "project_a_Sc001.json"
     Config(forest, resolver, filename=mid_level_path, root_paths=root_paths)
     check[1] = "hab.parsers.config.Config('project_a/Sc001')"
     assert check == repr_list(forest["project_a"])
@@ -256,14 +263,14 @@ def test_config_parenting(config_root, resolver):
     Config(
         forest,
         resolver,
-        filename=config_root / "configs" / "project_a" / "project_a_Sc001_rigging.json",
+        filename=project_a / "project_a_Sc001_rigging.json",
         root_paths=root_paths,
     )
     check.append("hab.parsers.config.Config('project_a/Sc001/Rigging')")
     assert check == repr_list(forest["project_a"])
 
     # Check that a root item is replaced
-    top_level_path = config_root / "configs" / "project_a" / "project_a.json"
+    top_level_path = project_a / "project_a.json"
     Config(forest, resolver, filename=top_level_path, root_paths=root_paths)
     check[0] = "hab.parsers.config.Config('project_a')"
     assert check == repr_list(forest["project_a"])
@@ -283,113 +290,94 @@ def test_config_parenting(config_root, resolver):
 
 
 def test_metaclass():
-    assert set(DistroVersion._properties.keys()) == set(
-        [
-            "alias_mods",
-            "aliases",
-            "distros",
-            "environment",
-            "environment_config",
-            "filename",
-            "min_verbosity",
-            "name",
-            "optional_distros",
-            "variables",
-            "version",
-        ]
-    )
-    assert set(Config._properties.keys()) == set(
-        [
-            "alias_mods",
-            "aliases",
-            "distros",
-            "environment",
-            "environment_config",
-            "filename",
-            "min_verbosity",
-            "inherits",
-            "name",
-            "omittable_distros",
-            "optional_distros",
-            "uri",
-            "variables",
-        ]
-    )
+    assert set(DistroVersion._properties) == {
+        "alias_mods",
+        "aliases",
+        "distros",
+        "environment",
+        "environment_config",
+        "filename",
+        "min_verbosity",
+        "name",
+        "optional_distros",
+        "variables",
+        "version",
+    }
+    assert set(Config._properties) == {
+        "alias_mods",
+        "aliases",
+        "distros",
+        "environment",
+        "environment_config",
+        "filename",
+        "min_verbosity",
+        "inherits",
+        "name",
+        "omittable_distros",
+        "optional_distros",
+        "uri",
+        "variables",
+    }
 
 
 class TestDump:
-    def test_dump(self, resolver):
-        line = "-LINE-"
+    # The expected dump output lines shared by every test_dump case
+    line = "-LINE-"
+    border = re.compile(r"^-+$", flags=re.M)
+    pre = ("name:  child", "uri:  not_set/child")
+    post = (
+        "inherits:  True",
+        "min_verbosity:  NotSet",
+        "optional_distros:  NotSet",
+    )
+    env = (
+        "environment:  FMT_FOR_OS:  a{;}b;c:{PATH!e}{;}d",
+        "              TEST:  case",
+        "              UNSET_VARIABLE:  None",
+    )
+    env_config = (
+        "environment_config:  set:  FMT_FOR_OS:  a{;}b;c:{PATH!e}{;}d",
+        "                           TEST:  case",
+        "                     unset:  UNSET_VARIABLE",
+    )
+
+    @pytest.mark.parametrize(
+        "environment,environment_config",
+        (
+            # Check that both environments can be hidden
+            (False, False),
+            # Check that both environments can be shown
+            (True, True),
+            # Check that only environment can be shown
+            (True, False),
+            # Check that only environment_config can be shown
+            (False, True),
+        ),
+    )
+    def test_dump(self, resolver, environment, environment_config):
+        line = self.line
 
         def standardize(txt):
             """Dump adds an arbitrary length border of -'s that makes str comparing
             hard. Replace it with a constant value."""
-            return re.sub(r"^-+$", line, txt, flags=re.M)
-
-        # Build the test data so we can generate the output to check
-        # Note: using `repr([u"` so this test passes in python 2 and 3
-        pre = ["name:  child", "uri:  not_set/child"]
-        post = [
-            "inherits:  True",
-            "min_verbosity:  NotSet",
-            "optional_distros:  NotSet",
-        ]
-        env = [
-            "environment:  FMT_FOR_OS:  a{;}b;c:{PATH!e}{;}d",
-            "              TEST:  case",
-            "              UNSET_VARIABLE:  None",
-        ]
+            return self.border.sub(line, txt)
 
-        env_config = [
-            "environment_config:  set:  FMT_FOR_OS:  a{;}b;c:{PATH!e}{;}d",
-            "                           TEST:  case",
-            "                     unset:  UNSET_VARIABLE",
-        ]
         cfg = resolver.closest_config("not_set/child")
         header = f"Dump of {type(cfg).__name__}('{cfg.fullpath}')"
 
-        # Check that both environments can be hidden
         result = cfg.dump(
-            environment=False, environment_config=False, verbosity=2, color=False
+            environment=environment,
+            environment_config=environment_config,
+            verbosity=2,
+            color=False,
         )
         check = [f"{header}\n{line}"]
-        check.extend(pre)
-        check.extend(post)
-        check.append(line)
-        check = "\n".join(check)
-        assert standardize(result) == check
-
-        # Check that both environments can be shown
-        result = cfg.dump(
-            environment=True, environment_config=True, verbosity=2, color=False
-        )
-        check = [f"{header}\n{line}"]
-        check.extend(pre)
-        check.extend(env)
-        check.extend(env_config)
-        check.extend(post)
-        check.append(line)
-        check = "\n".join(check)
-        assert standardize(result) == check
-
-        # Check that only environment can be shown
-        result = cfg.dump(
-            environment=True, environment_config=False, verbosity=2, color=False
-        )
-        check = [f"{header}\n{line}"]
-        check.extend(pre)
-        check.extend(env)
-        check.extend(post)
-        check.append(line)
-        check = "\n".join(check)
-        # Check that only environment_config can be shown
-        result = cfg.dump(
-            environment=False, environment_config=True, verbosity=2, color=False
-        )
-        check = [f"{header}\n{line}"]
-        check.extend(pre)
-        check.extend(env_config)
-        check.extend(post)
+        check.extend(self.pre)
+        if environment:
+            check.extend(self.env)
+        if environment_config:
+            check.extend(self.env_config)
+        check.extend(self.post)
         check.append(line)
         check = "\n".join(check)
         assert standardize(result) == check
@@ -467,10 +455,11 @@ def test_environment(resolver):
 
     # Check environment variable resolving
     cfg = resolver.closest_config("not_set/env1")
+    env = cfg.environment
 
-    assert cfg.environment["APPEND_VARIABLE"] == ["append_value"]
-    assert cfg.environment["MAYA_MODULE_PATH"] == ["MMP_Set"]
-    assert cfg.environment["PREPEND_VARIABLE"] == ["prepend_value"]
+    assert env["APPEND_VARIABLE"] == ["append_value"]
+    assert env["MAYA_MODULE_PATH"] == ["MMP_Set"]
+    assert env["PREPEND_VARIABLE"] == ["prepend_value"]
 
     check = [
         "{relative_root}/prepend",
@@ -480,11 +469,11 @@ def test_environment(resolver):
     relative_root = utils.path_forward_slash(cfg.dirname)
     check = [c.format(relative_root=relative_root) for c in check]
 
-    assert cfg.environment["RELATIVE_VARIABLE"] == check
-    assert cfg.environment["SET_RELATIVE"] == [f"{relative_root}"]
-    assert cfg.environment["SET_VARIABLE"] == ["set_value"]
-    assert cfg.environment["UNSET_VARIABLE"] is None
-    assert cfg.environment["UNSET_VARIABLE_1"] is None
+    assert env["RELATIVE_VARIABLE"] == check
+    assert env["SET_RELATIVE"] == [f"{relative_root}"]
+    assert env["SET_VARIABLE"] == ["set_value"]
+    assert env["UNSET_VARIABLE"] is None
+    assert env["UNSET_VARIABLE_1"] is None
 
     # Check `cfg.environment is NotSet` resolves correctly
     cfg = resolver.closest_config("not_set")
@@ -514,23 +503,22 @@ def test_flat_config(resolver):
         "ALIASED_GLOBAL_F": ["Global F"],
     }
 
-    assert ret.environment == check
-    assert ret.environment == check
-    assert ret.environment == check
+    # Check that environment is only resolved once and the cached value is
+    # returned for every access after the first one.
+    envs = [ret.environment for _ in range(3)]
+    assert envs[0] == check
+    assert envs[0] is envs[1] is envs[2]
 
     # Check for edge case where self._environment was reset if the config didn't define
     # environment, but the attached distros did.
     ret = resolver.resolve("not_set/no_env")
-    assert sorted(ret.environment.keys()) == [
-        "DCC_CONFIG_PATH",
-        "DCC_MODULE_PATH",
-        "HAB_URI",
-    ]
-    assert sorted(ret.environment.keys()) == [
+    env = ret.environment
+    assert sorted(env.keys()) == [
         "DCC_CONFIG_PATH",
         "DCC_MODULE_PATH",
         "HAB_URI",
     ]
+    assert ret.environment is env
 
 
 def test_flat_config_env_resolve(resolver, config_root, helpers):
@@ -543,13 +531,13 @@ def test_flat_config_env_resolve(resolver, config_root, helpers):
     # Ensure the the configuration files this test relies on are configured
     # correctly. This also serves as a explanation for why the final list being
     # checked is sorted in the way it is
-    raw_json = json.load(open(ret.filename))
+    raw_json = utils.load_json_file(Path(ret.filename))
     # The config only links to the "the_dcc" distro and no others.
     assert raw_json["distros"] == {"the_dcc": []}
 
     # The_dcc depends on these three distros in this order
     distro_root = config_root / "distros"
-    raw_json = json.load((distro_root / "the_dcc" / "1.2" / ".hab.json").open())
+    raw_json = utils.load_json_file(distro_root / "the_dcc" / "1.2" / ".hab.json")
     assert "the_dcc_plugin_a" in raw_json["distros"][0]
     assert "the_dcc_plugin_b" in raw_json["distros"][1]
     assert "the_dcc_plugin_e" in raw_json["distros"][2]
@@ -557,21 +545,21 @@ def test_flat_config_env_resolve(resolver, config_root, helpers):
     # the_dcc_plugin_a depends on these two distros in this order. The dependencies
     # are resolved down the tree so "e" will show up before "b".
     distro_root = config_root / "distros"
-    raw_json = json.load(
-        (distro_root / "the_dcc_plugin_a" / "1.1" / ".hab.json").open()
+    raw_json = utils.load_json_file(
+        distro_root / "the_dcc_plugin_a" / "1.1" / ".hab.json"
     )
     assert "the_dcc_plugin_e" in raw_json["distros"][0]
     assert "the_dcc_plugin_d" in raw_json["distros"][1]
 
     # Both environment variables are appended
     for plugin in ("the_dcc_plugin_a", "the_dcc_plugin_e"):
-        raw_json = json.load((distro_root / plugin / "1.1" / ".hab.json").open())
+        raw_json = utils.load_json_file(distro_root / plugin / "1.1" / ".hab.json")
         assert "DCC_CONFIG_PATH" in raw_json["environment"]["append"]
         assert "DCC_MODULE_PATH" in raw_json["environment"]["append"]
 
     # One env var is appended and the other is prepended
     for plugin in ("the_dcc_plugin_b", "the_dcc_plugin_d"):
-        raw_json = json.load((distro_root / plugin / "1.1" / ".hab.json").open())
+        raw_json = utils.load_json_file(distro_root / plugin / "1.1" / ".hab.json")
         assert "DCC_CONFIG_PATH" in raw_json["environment"]["prepend"]
         assert "DCC_MODULE_PATH" in raw_json["environment"]["append"]
 
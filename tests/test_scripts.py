@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 
 import pytest
@@ -51,7 +50,7 @@ def test_scripts(uncached_resolver, tmpdir, monkeypatch, config_root, reference_
     3. Replace the HAB_FREEZE value with `{{ freeze }}`.
     """
     reference = reference_scripts / reference_name
-    spec = json.load((reference / "spec.json").open())
+    spec = utils.load_json_file(reference / "spec.json")
 
     if "description" in spec:
         print(f"Testing: {spec['description']}")
@@ -114,9 +113,7 @@ def test_scripts(uncached_resolver, tmpdir, monkeypatch, config_root, reference_
 
         try:
             assert generated.exists()
-            assert (
-                ref_text == generated.open().read()
-            ), "Reference does not match generated"
+            assert ref_text == generated.read(), "Reference does not match generated"
         except AssertionError:
             print("")
             print(f"Reference: {item}")